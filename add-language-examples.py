@@ -6,16 +6,48 @@ Requires `es-request-converter` installed globally via npm.
 https://www.npmjs.com/package/@elastic/request-converter
 """
 
-import argparse
+import atexit
+import contextlib
+import functools
+import hashlib
+import io
+import itertools
+import json
+import os
 import re
+import shutil
+import sqlite3
 import subprocess
+import threading
 
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from tqdm import tqdm
+
+try:
+    import re2  # Optional: google-re2 gives linear-time matching for the whole-file patterns
+except ImportError:
+    re2 = None
+
+try:
+    import orjson  # Optional: faster encoding/decoding of the converter worker's JSON lines
+except ImportError:
+    orjson = None
 
 DEFAULT_LANGUAGES = ["curl", "python", "js", "php", "ruby"] 
 
+# Directories with more files than this are processed in parallel worker processes
+PARALLEL_FILE_THRESHOLD = 4
+
+# Progress bars are turned off in worker processes, where they would interleave
+_show_progress = True
+
+# Fewer items than this finish too quickly for a progress bar to be useful
+PROGRESS_MIN_ITEMS = 4
+
+# Source-of-truth snippet languages (never generated by the converter)
+SOURCE_LANGUAGES = frozenset({'console', 'esql'})
+
 # Mapping from user-friendly names to es-request-converter format names
 LANGUAGE_MAP = {
     "python": "Python",
@@ -26,23 +58,175 @@ LANGUAGE_MAP = {
     "curl": "curl"
 }
 
+LOCALHOST_URL = 'http://localhost:9200'
+
+
+
+def _compile_dotall(pattern):
+    """Compile a DOTALL pattern, using RE2 when installed to avoid backtracking on whole files"""
+    pattern = '(?s)' + pattern
+    if re2 is not None:
+        try:
+            return re2.compile(pattern)
+        except re2.error:
+            pass
+    return re.compile(pattern)
+
+
+# Precompiled patterns (avoids re's internal cache lookup on every call)
+_TRAILING_WS_RE = re.compile(r'[^\S\n]+$', re.MULTILINE)
+
+_ANN_MARKER_RE = re.compile(r'\s*<\d+>')
+_ANN_COMMENT_RE = re.compile(r'\s*#.*$', re.MULTILINE)
+
+_LOCALHOST_CURL_RE = re.compile(r'"http://localhost:9200')
+_CURL_METHOD_URL_RE = re.compile(r'(curl -X \w+)(.*?)(\s+"[^"]+")$', re.MULTILINE)
+_CURL_FLAG_BREAK_RE = re.compile(r' (-[Hd] )')
+_PY_HOSTS_RE = re.compile(r'hosts=\["http://localhost:9200"\]')
+_RUBY_HOST_RE = re.compile(r'host:\s*["\']http://localhost:9200["\']')
+_JS_NODES_RE = re.compile(r'nodes:\s*\["http://localhost:9200"\]')
+_PHP_SETHOSTS_RE = re.compile(r'->setHosts\(\["http://localhost:9200"\]\)')
+
+DIRECTIVES = ['stepper', 'step', 'dropdown', 'note', 'warning', 'tip', 'important', 'plain', 'tabs', 'tab-set', 'tab-item']
+# Opening directive lines (zero-width, colons are inserted at line start) and
+# closing lines made only of colons, keeping indentation and dropping trailing whitespace
+_DIRECTIVE_OPEN_RE = re.compile(r'^(?=:+\{(?:' + '|'.join(re.escape(d) for d in DIRECTIVES) + r')\})', re.MULTILINE)
+_DIRECTIVE_CLOSE_RE = re.compile(r'^([^\S\n]*)(:{3,})[^\S\n]*$', re.MULTILINE)
+
+_TABSET_START = '::::{tab-set}'
+_TABSET_BLOCK_RE = _compile_dotall(r'::::\{tab-set\}.*?::::')
+_SNIPPET_CODE_RE = _compile_dotall(r'```(?:console|esql)\n(.*?)\n```')
+_SNIPPET_ANNOTATIONS_RE = re.compile(r'```\n\n(\d+\.[^\n]+(?:\n\d+\.[^\n]+)*)')
+_CONSOLE_SNIPPET_NAME_RE = re.compile(r'example(\d+)-console\.md')
+_INCLUDE_EXAMPLE_RE = re.compile(r'(_snippets/([^/\s]+)/example)(\d+)(-\w+\.md)')
+_ESQL_SNIPPET_NAME_RE = re.compile(r'example(\d+)-esql\.md')
+
+_TAB_PATTERN = r':::+\{{tab-item\}}\s+{label}\s*\n\s*:sync:\s+{sync}'
+_TAB_ITEM_RE = re.compile(r'\{tab-item\}', re.IGNORECASE)
+_ESQL_TAB_RE = re.compile(_TAB_PATTERN.format(label=r'ES\|QL', sync='esql'), re.IGNORECASE)
+
+
+def _lang_tab_re(lang):
+    """Build the pattern matching a "{tab-item} Label" followed by ":sync: lang" pair"""
+    return re.compile(
+        _TAB_PATTERN.format(label=re.escape(lang.capitalize()), sync=re.escape(lang.lower())),
+        re.IGNORECASE
+    )
+
+
+_LANG_TAB_RES = {lang: _lang_tab_re(lang) for lang in LANGUAGE_MAP}
+
+# Markdown templates, built once (bound str.format methods)
+_TAB_SET_START = _TABSET_START + "\n:group: api-examples\n\n"
+_CONSOLE_TAB_TPL = ":::{{tab-item}} Console\n:sync: console\n```console\n{code}\n```\n".format
+_ESQL_TAB_TPL = ":::{{tab-item}} ES|QL\n:sync: esql\n```esql\n{code}\n```\n".format
+_LANG_TAB_TPL = "\n:::{{tab-item}} {label}\n:sync: {sync}\n```{code_lang}\n{code}\n```\n:::\n".format
+_INCLUDE_TAB_TPL = ":::{{tab-item}} {label}\n:sync: {sync}\n\n".format
+_INCLUDE_TPL = ":::{{include}} {snippets_dir_name}/{parent_filename}/example{example_num}-{lang}.md\n:::".format
+_SOURCE_SNIPPET_TPL = "```{code_lang}\n{code}\n```\n".format
+_GENERATED_SNIPPET_TPL = """% WARNING: This snippet is auto-generated. Do not edit directly.
+
+% See https://github.com/leemthompo/python-console-converter/blob/main/README.md
+
+```{code_lang}
+{code}
+```
+""".format
+
+
+def _annotation_list_end(markdown_text, pos):
+    """Find the end of a numbered annotation list starting at pos
+
+    The list must be separated from the code block by a blank line ("\n\n")
+    and each line must look like "1. text". Returns pos if no list follows.
+    """
+    if not markdown_text.startswith('\n\n', pos):
+        return pos
+
+    end = pos
+    line_start = pos + 2
+    text_len = len(markdown_text)
+    while line_start < text_len:
+        line_end = markdown_text.find('\n', line_start)
+        if line_end == -1:
+            line_end = text_len
+        line = markdown_text[line_start:line_end]
+        number = 0
+        while number < len(line) and line[number].isdecimal():
+            number += 1
+        if not (number and line[number:number + 1] == '.' and len(line) > number + 1):
+            break
+        end = line_end
+        line_start = line_end + 1
+    return end
+
+
+def _scan_code_blocks(markdown_text, block_types):
+    """Locate fenced code blocks of the given types in a single linear pass
+
+    Each opening fence (e.g. "```console\n") is paired with the next closing
+    fence ("\n```"), optionally followed by a numbered annotation list. Built on
+    str.find, so there is no backtracking even on large or malformed files.
+
+    Yields tuples: (block_type, start, end, code, annotations)
+    annotations is None if no list follows the block
+    """
+    openers = {block_type: f"```{block_type}\n" for block_type in block_types}
+    next_open = {block_type: markdown_text.find(opener) for block_type, opener in openers.items()}
+
+    while True:
+        found = [(start, block_type) for block_type, start in next_open.items() if start != -1]
+        if not found:
+            return
+        start, block_type = min(found)
+
+        code_start = start + len(openers[block_type])
+        close = markdown_text.find('\n```', code_start)
+        if close == -1:
+            return  # No closing fence left for this or any later block
+
+        fence_end = close + 4
+        end = _annotation_list_end(markdown_text, fence_end)
+        annotations = markdown_text[fence_end + 2:end] if end != fence_end else None
+        yield block_type, start, end, markdown_text[code_start:close], annotations
+
+        # Advance past this block any opener that now points inside it
+        for other_type, other_start in next_open.items():
+            if other_start != -1 and other_start < end:
+                next_open[other_type] = markdown_text.find(openers[other_type], end)
+
+
+@functools.lru_cache(maxsize=8)
+def _source_blocks(markdown_text):
+    """Scan a markdown text for console and esql blocks, memoized per text
+
+    process_file extracts both block types and then replaces them in the same
+    text, so all three share one scan.
+    """
+    return tuple(_scan_code_blocks(markdown_text, ('console', 'esql')))
+
+
 def extract_code_blocks(markdown_text, block_type):
     """Extract code blocks with their following annotation lists
 
     Returns list of tuples: (code_block, annotation_list)
     annotation_list is empty string if no annotations follow the block
     """
-    # Pattern to match block followed by optional numbered list
-    # Numbered list can be after 1 or 2 newlines
+    # Block followed by optional numbered list
+    # Numbered list must come after a blank line
     # Numbered list stops before double newline or before text that doesn't start with a number
-    pattern = fr"```{block_type}\n(.*?)\n```(?:\n\n(\d+\.[^\n]+(?:\n\d+\.[^\n]+)*))?"
-    matches = re.findall(pattern, markdown_text, re.DOTALL)
-    
+    skip_results = block_type == 'console'
+
     # Filter out result blocks and return tuples of (code, annotations)
     blocks = []
-    for code, annotations in matches:
-        if block_type != 'console' or not code.startswith('-result'):
-            blocks.append((code, annotations.strip() if annotations else ''))
+    if block_type in SOURCE_LANGUAGES:
+        scanned = _source_blocks(markdown_text)
+    else:
+        scanned = _scan_code_blocks(markdown_text, (block_type,))
+    for scanned_type, _, _, code, annotations in scanned:
+        if scanned_type != block_type or (skip_results and code.startswith('-result')):
+            continue
+        blocks.append((code, annotations.strip() if annotations else ''))
     return blocks
 
 
@@ -65,41 +249,406 @@ def esql_to_console(esql_content):
     return console_format
 
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+# One-off converter processes run at once (without the Node worker), and block pool size
+CONVERTER_CONCURRENCY = min(32, (os.cpu_count() or 4) * 4)
 
-def _convert_single_language(lang, console_content, complete, converter_lang):
-    """Convert console code to a single target language."""
-    try:
-        cmd = ['es-request-converter', '--format', converter_lang, '--print-response']
-        if complete:
-            cmd.append('--complete')
+# Shared pool that builds each converted block's snippets and tab-set, reused across all
+# blocks and files (conversions themselves go to the Node worker or asyncio subprocesses)
+_BLOCK_POOL = ThreadPoolExecutor(
+    max_workers=CONVERTER_CONCURRENCY,
+    thread_name_prefix='block'
+)
+atexit.register(_BLOCK_POOL.shutdown)
+
+# Separate pool for snippet file writes so they overlap with conversions
+_WRITER_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix='snippet-writer')
+atexit.register(_WRITER_POOL.shutdown)
 
-        result = subprocess.run(
-            cmd,
-            input=console_content,
+# Snippet files written per writer pool task (covers a block's source and language snippets)
+SNIPPET_WRITE_BATCH = 8
+
+
+# Node worker script shipped next to this file (see converter_server.js)
+CONVERTER_SERVER = Path(__file__).resolve().with_name('converter_server.js')
+
+
+def _json_dumps(obj):
+    """Encode a worker message as a JSON string (with orjson when installed)"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode('utf-8')
+    return json.dumps(obj)
+
+
+def _json_loads(text):
+    """Decode a worker message (with orjson when installed)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+class _ConverterWorker:
+    """Persistent Node process serving conversions over stdin/stdout.
+
+    Requests are tagged with an id and written as JSON lines (a line may hold
+    an array of requests); a reader thread resolves the matching Future for
+    each response, so many conversions can be in flight at once.
+    """
+
+    def __init__(self, package_dir):
+        self._proc = subprocess.Popen(
+            ['node', str(CONVERTER_SERVER), str(package_dir)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
             text=True,
-            capture_output=True,
-            check=True
+            encoding='utf-8',
+            bufsize=1
         )
-        cleaned_code = '\n'.join(line.rstrip() for line in result.stdout.splitlines())
-        return lang, cleaned_code, None
-    except subprocess.CalledProcessError as e:
-        error_lines = e.stderr.strip().split('\n')
-        error_msg = None
-        for line in error_lines:
-            if 'Error:' in line or 'TypeError:' in line:
-                error_msg = line.strip()
-                break
-        if not error_msg:
-            error_msg = error_lines[0] if error_lines else "Conversion failed"
-        return lang, console_content, error_msg
-    except FileNotFoundError:
-        error_msg = "es-request-converter not found (install: npm install -g @elastic/request-converter)"
-        return lang, console_content, error_msg
+        self._lock = threading.Lock()
+        self._pending = {}
+        self._ids = itertools.count()
+        self.alive = True
+        threading.Thread(target=self._read_responses, daemon=True).start()
+
+    def submit_many(self, conversions):
+        """Send several conversion requests as one line without waiting
+
+        Args:
+            conversions: List of (console_content, converter_lang, complete) tuples
+
+        Returns:
+            list: One Future of (code, error) per conversion, in input order
+        """
+        futures = []
+        requests = []
+        with self._lock:
+            if not self.alive:
+                raise RuntimeError("converter worker exited")
+            for console_content, converter_lang, complete in conversions:
+                request_id = next(self._ids)
+                future = self._pending[request_id] = Future()
+                futures.append(future)
+                requests.append({'id': request_id, 'format': converter_lang, 'complete': complete,
+                                 'console': console_content})
+            self._proc.stdin.write(_json_dumps(requests) + '\n')
+        return futures
+
+    def close(self):
+        with self._lock:
+            self.alive = False
+            try:
+                self._proc.stdin.close()
+            except OSError:
+                pass
+        self._proc.wait()
+
+    def _read_responses(self):
+        try:
+            for line in self._proc.stdout:
+                response = _json_loads(line)
+                request_id, code, error = response['id'], response['code'], response['error']
+                with self._lock:
+                    future = self._pending.pop(request_id)
+                future.set_result((code, error))
+        except (ValueError, KeyError, TypeError):
+            # Malformed response, the protocol is out of sync: stop the worker and treat it as dead
+            self._proc.kill()
+        finally:
+            # Worker exited (e.g. library could not be loaded) - fail anything still waiting
+            with self._lock:
+                self.alive = False
+                pending, self._pending = self._pending, {}
+            for future in pending.values():
+                future.set_exception(RuntimeError("converter worker exited"))
+
+
+_worker = None
+_worker_restarts = 0
+_worker_lock = threading.Lock()
+
+# How often a worker that exited mid-run is replaced before falling back to one-off converter processes
+WORKER_MAX_RESTARTS = 2
+
+# Conversions sent to the worker per request line
+WORKER_BATCH_SIZE = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _converter_package():
+    """Locate the globally installed @elastic/request-converter package
+
+    Returns:
+        tuple: (package directory, version), or (None, None) if it can't be found
+    """
+    executable = shutil.which('es-request-converter')
+    if not executable:
+        return None, None
+    for parent in Path(executable).resolve().parents:
+        package_json = parent / 'package.json'
+        if package_json.exists():
+            try:
+                with open(package_json, 'r', encoding='utf-8') as f:
+                    package = json.load(f)
+                if package.get('name') == '@elastic/request-converter':
+                    return parent, package.get('version')
+            except (OSError, ValueError):
+                pass
+    return None, None
+
+
+def _find_converter_package():
+    """Locate the globally installed @elastic/request-converter package directory"""
+    return _converter_package()[0]
+
+
+def _get_converter_worker():
+    """Lazily start the Node worker shared by the whole run, returns None if it cannot be used
+
+    A worker that exits mid-run is replaced, up to WORKER_MAX_RESTARTS times.
+    """
+    global _worker, _worker_restarts
+    with _worker_lock:
+        if _worker and not _worker.alive and _worker_restarts < WORKER_MAX_RESTARTS:
+            _worker_restarts += 1
+            _worker = None
+        if _worker is None:
+            package_dir = _find_converter_package()
+            if not package_dir or not CONVERTER_SERVER.exists() or not shutil.which('node'):
+                _worker = False
+            else:
+                try:
+                    _worker = _ConverterWorker(package_dir)
+                    atexit.register(_worker.close)
+                except OSError:
+                    _worker = False
+        return _worker if _worker and _worker.alive else None
+
+
+class _NoProgress:
+    """Stand-in for a tqdm bar when no progress bar is shown"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def update(self, n=1):
+        pass
+
+
+def _progress_bar(total, desc, unit):
+    """Create a tqdm progress bar, or a no-op one for quiet or short runs
+
+    tqdm is imported on first use, so runs that never show a bar don't pay for it.
+    """
+    if not _show_progress or total < PROGRESS_MIN_ITEMS:
+        return _NoProgress()
+    from tqdm import tqdm
+    return tqdm(total=total, desc=desc, unit=unit)
+
+
+def _clean_converted_code(code):
+    """Strip trailing whitespace from every line of converter output (and the final newline)"""
+    if code.endswith('\n'):
+        code = code[:-1]
+    return _TRAILING_WS_RE.sub('', code)
+
+
+CONVERTER_NOT_FOUND = "es-request-converter not found (install: npm install -g @elastic/request-converter)"
+
+
+@functools.lru_cache(maxsize=None)
+def _converter_command(converter_lang, complete):
+    """Build the es-request-converter command line (a tuple, shared between calls)"""
+    cmd = ('es-request-converter', '--format', converter_lang, '--print-response')
+    if complete:
+        cmd += ('--complete',)
+    return cmd
+
+
+def _converter_error_message(stderr):
+    """Pick the most relevant line from es-request-converter's stderr"""
+    error_lines = stderr.strip().split('\n')
+    for line in error_lines:
+        if 'Error:' in line or 'TypeError:' in line:
+            return line.strip()
+    return error_lines[0] if error_lines else "Conversion failed"
+
+
+def _worker_result(lang, console_content, code, error):
+    """Turn a worker response into a (lang, code, error) conversion result"""
+    if error:
+        return lang, console_content, error
+    return lang, _clean_converted_code(code), None
+
+
+async def _convert_single_language_async(lang, console_content, complete, converter_lang, semaphore):
+    """Convert console code to a single target language in a one-off converter process."""
+    import asyncio
+
+    async with semaphore:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *_converter_command(converter_lang, complete),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+        except FileNotFoundError:
+            return lang, console_content, CONVERTER_NOT_FOUND
+        stdout, stderr = await proc.communicate(console_content.encode('utf-8'))
+
+    if proc.returncode != 0:
+        return lang, console_content, _converter_error_message(stderr.decode('utf-8', errors='replace'))
+    return lang, _clean_converted_code(stdout.decode('utf-8')), None
+
+
+async def _convert_all_async(tasks, on_result):
+    """Run one-off converter processes concurrently on a single event loop.
+
+    Args:
+        tasks: List of (key, lang, console_content, complete, converter_lang) tuples
+        on_result: Called with (key, (lang, code, error)) as each conversion completes
+    """
+    import asyncio
+
+    # Cap concurrent processes so huge files don't fork-bomb the machine
+    semaphore = asyncio.Semaphore(CONVERTER_CONCURRENCY)
+
+    async def run(key, *args):
+        return key, await _convert_single_language_async(*args, semaphore)
+
+    for next_done in asyncio.as_completed([run(*task) for task in tasks]):
+        on_result(*await next_done)
+
+
+# Successful conversions for this run: {"digest|format|complete": code}
+_CONV_CACHE = {}
+
+# Successful conversions are also kept on disk, so unchanged blocks aren't converted again on later
+# runs (the cache is tied to the installed converter version, see _get_disk_cache)
+_disk_cache = None
+_disk_cache_lock = threading.Lock()
+
+
+def _conversion_key(console_content, converter_lang, complete):
+    """Cache key for a conversion, hashing the console content"""
+    digest = hashlib.blake2b(console_content.encode('utf-8'), digest_size=16).hexdigest()
+    return f"{digest}|{converter_lang}|{int(complete)}"
+
+
+def _conversion_cache_path():
+    """Location of the on-disk conversion cache (under $XDG_CACHE_HOME or ~/.cache)"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+    return Path(cache_home) / 'add-language-examples' / 'conversions.sqlite3'
+
+
+def _get_disk_cache():
+    """Open the on-disk conversion cache, returns None if it can't be used
+
+    Cached output is only valid for the converter version that produced it, so
+    the cache is emptied whenever the installed version changes. Without a known
+    version the on-disk cache isn't used.
+    """
+    global _disk_cache
+    with _disk_cache_lock:
+        if _disk_cache is None:
+            db = False  # Don't retry, run with the in-memory cache only
+            version = _converter_package()[1]
+            if version:
+                try:
+                    cache_path = _conversion_cache_path()
+                    cache_path.parent.mkdir(parents=True, exist_ok=True)
+                    db = sqlite3.connect(cache_path, timeout=30, check_same_thread=False)
+                    db.execute('PRAGMA journal_mode=WAL')  # Parallel file workers share the cache
+                    with db:
+                        db.execute('CREATE TABLE IF NOT EXISTS conversions (key TEXT PRIMARY KEY, code TEXT NOT NULL)')
+                        db.execute('CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)')
+                        row = db.execute("SELECT value FROM meta WHERE name = 'converter_version'").fetchone()
+                        if row is None or row[0] != version:
+                            db.execute('DELETE FROM conversions')
+                            db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('converter_version', ?)",
+                                       (version,))
+                except (OSError, RuntimeError, sqlite3.Error):
+                    if db:
+                        db.close()
+                    db = False
+                else:
+                    atexit.register(db.close)
+            _disk_cache = db
+        return _disk_cache or None
+
+
+def _cached_conversion(key):
+    """Look up a conversion in the run cache, then on disk"""
+    code = _CONV_CACHE.get(key)
+    if code is None:
+        db = _get_disk_cache()
+        if db is not None:
+            try:
+                with _disk_cache_lock:
+                    row = db.execute('SELECT code FROM conversions WHERE key = ?', (key,)).fetchone()
+            except sqlite3.Error:
+                row = None
+            if row is not None:
+                code = _CONV_CACHE[key] = row[0]
+    return code
+
+
+def _store_conversions(entries):
+    """Save new conversions ({key: code}) to the on-disk cache in one transaction"""
+    db = _get_disk_cache()
+    if not entries or db is None:
+        return
+    try:
+        with _disk_cache_lock, db:
+            db.executemany('INSERT OR REPLACE INTO conversions (key, code) VALUES (?, ?)', entries.items())
+    except sqlite3.Error:
+        pass  # The cache is only an optimization
+
+
+def clear_conversion_cache():
+    """Drop all cached conversions (used by --regenerate to pick up converter updates)"""
+    _CONV_CACHE.clear()
+    db = _get_disk_cache()
+    if db is not None:
+        try:
+            with _disk_cache_lock, db:
+                db.execute('DELETE FROM conversions')
+        except sqlite3.Error:
+            pass
 
 
 def convert_console(console_content, language=None, complete=True):
     """Convert console syntax using es-request-converter (parallelized)."""
+    return convert_console_batch([console_content], language, complete_first=complete)[0]
+
+
+def convert_console_batch(console_blocks, language=None, complete_first=True, progress=None,
+                          on_converted=None, complete_blocks=None):
+    """Convert several console snippets at once (parallelized across blocks and languages).
+
+    All (block, language) conversions are sent up front, pipelined to the Node
+    worker or run as concurrent asyncio subprocesses, so one slow block no longer
+    holds up the blocks after it.
+
+    Args:
+        console_blocks: List of console request strings
+        language: Target language(s), same as convert_console
+        complete_first: Whether the first block keeps client boilerplate
+        progress: Optional tqdm bar, advanced once per fully converted block
+        on_converted: Optional callback(index, (results, errors)), called as soon as
+            each block is fully converted so follow-up work can start early
+        complete_blocks: Optional set of block indices that keep client boilerplate,
+            overrides complete_first (used when a batch spans several files)
+
+    Returns:
+        list: One (results, errors) tuple per block, in input order
+    """
+    if complete_blocks is None:
+        complete_blocks = {0} if complete_first else set()
+
     # Normalize language parameter
     if language is None:
         languages = DEFAULT_LANGUAGES
@@ -107,32 +656,94 @@ def convert_console(console_content, language=None, complete=True):
         languages = [language]
     else:
         languages = language
-    
-    results = {}
-    errors = {}
 
-    # Prepare conversion tasks
+    batch = [({}, {}) for _ in console_blocks]
+    pending = [0] * len(console_blocks)
     tasks = []
-    for lang in languages:
-        converter_lang = LANGUAGE_MAP.get(lang.lower())
-        if not converter_lang:
-            errors[lang] = f"Unsupported language: {lang}"
-            results[lang] = console_content
-        else:
-            tasks.append((lang, console_content, complete, converter_lang))
-    
-    # Run conversions in parallel
-    with ThreadPoolExecutor(max_workers=len(tasks) * 1.5) as executor:
-        futures = {executor.submit(_convert_single_language, *task): task[0] 
-                   for task in tasks}
-        
-        for future in as_completed(futures):
-            lang, code, error = future.result()
+    waiting = {}  # {conversion key: [(block index, lang), ...]} so duplicate blocks are converted once
+    new_conversions = {}
+
+    def block_done(i):
+        if progress is not None:
+            progress.update(1)
+        if on_converted is not None:
+            on_converted(i, batch[i])
+
+    # Prepare conversion tasks, skipping anything already converted in this or an earlier run
+    for i, console_content in enumerate(console_blocks):
+        results, errors = batch[i]
+        complete = i in complete_blocks
+        for lang in languages:
+            converter_lang = LANGUAGE_MAP.get(lang.lower())
+            if not converter_lang:
+                errors[lang] = f"Unsupported language: {lang}"
+                results[lang] = console_content
+                continue
+            key = _conversion_key(console_content, converter_lang, complete)
+            cached = _cached_conversion(key)
+            if cached is not None:
+                results[lang] = cached
+                continue
+            if key not in waiting:
+                waiting[key] = []
+                tasks.append((key, lang, console_content, complete, converter_lang))
+            waiting[key].append((i, lang))
+            pending[i] += 1
+        if not pending[i]:
+            block_done(i)
+
+    def record(key, result):
+        _, code, error = result
+        if not error:
+            _CONV_CACHE[key] = new_conversions[key] = code
+        for i, lang in waiting.pop(key):
+            results, errors = batch[i]
             results[lang] = code
             if error:
                 errors[lang] = error
-    
-    return results, errors
+            pending[i] -= 1
+            if not pending[i]:
+                block_done(i)
+
+    # Only start the worker when something actually needs converting
+    worker = _get_converter_worker() if tasks else None
+    if worker is not None:
+        # Node worker: every request is pipelined over its stdin up front, no thread per request,
+        # sent in chunks so each write carries several conversions
+        futures = {}
+        for start in range(0, len(tasks), WORKER_BATCH_SIZE):
+            chunk = tasks[start:start + WORKER_BATCH_SIZE]
+            try:
+                chunk_futures = worker.submit_many(
+                    [(console_content, converter_lang, complete)
+                     for _, _, console_content, complete, converter_lang in chunk]
+                )
+            except (OSError, RuntimeError) as e:
+                chunk_futures = [Future() for _ in chunk]
+                for future in chunk_futures:
+                    future.set_exception(RuntimeError(str(e)))
+            futures.update(zip(chunk_futures, chunk))
+        failed = []
+        for future in as_completed(futures):
+            key, lang, console_content, complete, converter_lang = futures[future]
+            try:
+                code, error = future.result()
+            except RuntimeError:
+                failed.append(futures[future])
+            else:
+                record(key, _worker_result(lang, console_content, code, error))
+        if failed:
+            # Worker died: fall back to one-off converter processes, run concurrently
+            import asyncio
+            asyncio.run(_convert_all_async(failed, record))
+    elif tasks:
+        # No worker: one converter process per conversion, multiplexed with asyncio
+        # (only imported here, most runs use the worker)
+        import asyncio
+        asyncio.run(_convert_all_async(tasks, record))
+
+    _store_conversions(new_conversions)
+    return batch
 
 
 def format_curl(code):
@@ -145,15 +756,18 @@ def format_curl(code):
     Also replaces http://localhost:9200 with $ELASTICSEARCH_URL
     """
     # Replace localhost URL with environment variable
-    code = re.sub(r'"http://localhost:9200', r'"$ELASTICSEARCH_URL', code)
+    if LOCALHOST_URL in code:
+        code = _LOCALHOST_CURL_RE.sub(r'"$ELASTICSEARCH_URL', code)
 
     # Move URL to right after -X METHOD first
-    code = re.sub(r'(curl -X \w+)(.*?)(\s+"[^"]+")$', r'\1\3\2', code, flags=re.MULTILINE)
+    if 'curl -X ' in code:
+        code = _CURL_METHOD_URL_RE.sub(r'\1\3\2', code)
 
     # Add line breaks before -H and -d flags
-    formatted = re.sub(r' (-[Hd] )', r' \\\n  \1', code)
+    if ' -H ' in code or ' -d ' in code:
+        code = _CURL_FLAG_BREAK_RE.sub(r' \\\n  \1', code)
 
-    return formatted
+    return code
 
 
 def format_python(code):
@@ -162,8 +776,9 @@ def format_python(code):
     Replaces: hosts=["http://localhost:9200"]
     With: hosts=[os.getenv("ELASTICSEARCH_URL")]
     """
-    code = re.sub(
-        r'hosts=\["http://localhost:9200"\]',
+    if LOCALHOST_URL not in code:
+        return code
+    code = _PY_HOSTS_RE.sub(
         r'hosts=[os.getenv("ELASTICSEARCH_URL")]',
         code
     )
@@ -176,8 +791,9 @@ def format_ruby(code):
     Replaces: host: "http://localhost:9200"
     With: host: ENV["ELASTICSEARCH_URL"]
     """
-    code = re.sub(
-        r'host:\s*["\']http://localhost:9200["\']',
+    if LOCALHOST_URL not in code:
+        return code
+    code = _RUBY_HOST_RE.sub(
         r'host: ENV["ELASTICSEARCH_URL"]',
         code
     )
@@ -190,8 +806,9 @@ def format_javascript(code):
     Replaces: nodes: ["http://localhost:9200"]
     With: nodes: [process.env["ELASTICSEARCH_URL"]]
     """
-    code = re.sub(
-        r'nodes:\s*\["http://localhost:9200"\]',
+    if LOCALHOST_URL not in code:
+        return code
+    code = _JS_NODES_RE.sub(
         r'nodes: [process.env["ELASTICSEARCH_URL"]]',
         code
     )
@@ -204,14 +821,35 @@ def format_php(code):
     Replaces: ->setHosts(["http://localhost:9200"])
     With: ->setHosts([getenv("ELASTICSEARCH_URL")])
     """
-    code = re.sub(
-        r'->setHosts\(\["http://localhost:9200"\]\)',
+    if LOCALHOST_URL not in code:
+        return code
+    code = _PHP_SETHOSTS_RE.sub(
         r'->setHosts([getenv("ELASTICSEARCH_URL")])',
         code
     )
     return code
 
 
+# Per-language post-processing: {lang: (formatter, code block language, tab label)}
+_LANG_DISPATCH = {
+    'python': (format_python, 'python', 'Python'),
+    'ruby': (format_ruby, 'ruby', 'Ruby'),
+    'js': (format_javascript, 'js', 'JavaScript'),
+    'javascript': (format_javascript, 'js', 'JavaScript'),
+    'php': (format_php, 'php', 'PHP'),
+    'curl': (format_curl, 'bash', 'curl'),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _lang_info(lang):
+    """Look up (formatter, code_lang, label) for a target language, case-insensitively"""
+    info = _LANG_DISPATCH.get(lang)
+    if info is None:
+        info = _LANG_DISPATCH.get(lang.lower(), (None, lang, lang.capitalize()))
+    return info
+
+
 def strip_annotations(code):
     """Remove annotation markers from code
 
@@ -220,9 +858,11 @@ def strip_annotations(code):
     - Comment annotations: # comment text
     """
     # Remove <N> style markers
-    code = re.sub(r'\s*<\d+>', '', code)
+    if '<' in code:
+        code = _ANN_MARKER_RE.sub('', code)
     # Remove # comment annotations
-    code = re.sub(r'\s*#.*$', '', code, flags=re.MULTILINE)
+    if '#' in code:
+        code = _ANN_COMMENT_RE.sub('', code)
     return code
 
 
@@ -236,24 +876,17 @@ def increment_directive_delimiters(text, levels=1):
     Returns:
         Fixed markdown text with incremented nesting levels
     """
-    directives = ['stepper', 'step', 'dropdown', 'note', 'warning', 'tip', 'important', 'plain', 'tabs', 'tab-set', 'tab-item']
-    lines = text.split('\n')
-    result = []
-    directive_pattern = '|'.join(re.escape(d) for d in directives)
+    if ':' not in text:
+        return text
+
     add_colons = ':' * levels
 
-    for line in lines:
-        # Opening directive
-        if re.match(rf'^(:+)\{{({directive_pattern})\}}', line):
-            result.append(add_colons + line)
-        # Closing (only colons)
-        elif re.match(r'^(:{3,})$', line.strip()):
-            ws = line[:len(line) - len(line.lstrip())]
-            result.append(ws + add_colons + line.strip())
-        else:
-            result.append(line)
+    # Opening directives
+    text = _DIRECTIVE_OPEN_RE.sub(add_colons, text)
+    # Closings (only colons)
+    text = _DIRECTIVE_CLOSE_RE.sub(rf'\g<1>{add_colons}\g<2>', text)
 
-    return '\n'.join(result)
+    return text
 
 def prepare_code_for_conversion(code, block_type, annotations):
     """Prepare code and create the first tab based on block type.
@@ -270,15 +903,10 @@ def prepare_code_for_conversion(code, block_type, annotations):
     
     if block_type == 'esql':
         # Build ES|QL tab
-        first_tab = f""":::{{tab-item}} ES|QL
-:sync: esql
-```esql
-{code}
-```
-"""
+        parts = [_ESQL_TAB_TPL(code=code)]
         if annotations:
-            first_tab += annotations + "\n"
-        first_tab += ":::\n"
+            parts.append(annotations + "\n")
+        parts.append(":::\n")
         
         # Convert to console format for other languages
         code_no_annotations = strip_annotations(code)
@@ -286,24 +914,35 @@ def prepare_code_for_conversion(code, block_type, annotations):
         
     else:  # console
         # Build Console tab
-        first_tab = f""":::{{tab-item}} Console
-:sync: console
-```console
-{code}
-```
-"""
+        parts = [_CONSOLE_TAB_TPL(code=code)]
         if annotations:
-            first_tab += annotations + "\n"
-        first_tab += ":::\n"
+            parts.append(annotations + "\n")
+        parts.append(":::\n")
         
         # Strip annotations before converting
         code_to_convert = strip_annotations(code)
     
-    return code_to_convert, first_tab
+    return code_to_convert, "".join(parts)
 
 
-def write_snippet_file(snippets_dir, parent_filename, example_num, lang, code, annotations=''):
-    """Write a code snippet to a file (code block only, no tab wrapper).
+def get_code_to_convert(code, block_type):
+    """Get the console request to feed the converter for a code block.
+
+    Args:
+        code: The code block content (console or esql)
+        block_type: Either 'console' or 'esql'
+
+    Returns:
+        Console-formatted request with annotations stripped
+    """
+    code_no_annotations = strip_annotations(code.strip())
+    if block_type == 'esql':
+        return esql_to_console(code_no_annotations)
+    return code_no_annotations
+
+
+def build_snippet_file(snippets_dir, parent_filename, example_num, lang, code, annotations=''):
+    """Build the path and content of a code snippet file (code block only, no tab wrapper).
 
     Args:
         snippets_dir: Path to _snippets/{parent_filename} directory
@@ -314,61 +953,101 @@ def write_snippet_file(snippets_dir, parent_filename, example_num, lang, code, a
         annotations: Optional annotations to append after code block
 
     Returns:
-        Path to the created snippet file
+        tuple: (snippet_path, snippet_content)
     """
     snippet_filename = f"example{example_num}-{lang}.md"
     snippet_path = snippets_dir / snippet_filename
 
-    # Determine code language for syntax highlighting
-    if lang == 'esql':
-        code_lang = 'esql'
-    elif lang == 'console':
-        code_lang = 'console'
-    elif lang == 'curl':
-        code = format_curl(code)
-        code_lang = 'bash'
-    elif lang.lower() == 'python':
-        code = format_python(code)
-        code_lang = 'python'
-    elif lang.lower() == 'ruby':
-        code = format_ruby(code)
-        code_lang = 'ruby'
-    elif lang.lower() in ['js', 'javascript']:
-        code = format_javascript(code)
-        code_lang = 'js'
-    elif lang.lower() == 'php':
-        code = format_php(code)
-        code_lang = 'php'
-    else:
+    # Determine code language for syntax highlighting and apply post-processing
+    if lang in SOURCE_LANGUAGES:
         code_lang = lang
+    else:
+        formatter, code_lang, _ = _lang_info(lang)
+        if formatter:
+            code = formatter(code)
 
     # Build snippet content - add warning for generated snippets only
     # Don't add warning to console/esql as they are the source of truth
-    if lang not in ['console', 'esql']:
-        snippet_content = f"""% WARNING: This snippet is auto-generated. Do not edit directly.
-
-% See https://github.com/leemthompo/python-console-converter/blob/main/README.md
-
-```{code_lang}
-{code}
-```
-"""
+    if lang not in SOURCE_LANGUAGES:
+        snippet_content = _GENERATED_SNIPPET_TPL(code_lang=code_lang, code=code)
     else:
-        snippet_content = f"""```{code_lang}
-{code}
-```
-"""
+        snippet_content = _SOURCE_SNIPPET_TPL(code_lang=code_lang, code=code)
 
     if annotations:
         snippet_content += "\n" + annotations + "\n"
 
-    # Write snippet file
-    with open(snippet_path, 'w', encoding='utf-8') as f:
-        f.write(snippet_content)
+    return snippet_path, snippet_content
+
+
+def _write_text(path, content):
+    """Write a UTF-8 text file"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+def write_markdown_if_changed(filepath, original_text, updated_text, pending_writes=None):
+    """Write updated markdown back unless it is identical to what was read
+
+    Skipping no-op writes keeps mtimes (and downstream rebuilds) untouched.
+    With pending_writes (a list), the write runs on the writer pool and its
+    future is appended to the list.
+
+    Returns:
+        bool: True if the file is (being) written, False if it was unchanged
+    """
+    if updated_text == original_text:
+        return False
+    if pending_writes is None:
+        _write_text(filepath, updated_text)
+    else:
+        pending_writes.append(_WRITER_POOL.submit(_write_text, filepath, updated_text))
+    return True
+
 
+def write_snippet_file(snippets_dir, parent_filename, example_num, lang, code, annotations=''):
+    """Write a code snippet to a file (code block only, no tab wrapper).
+
+    Takes the same arguments as build_snippet_file.
+
+    Returns:
+        Path to the created snippet file
+    """
+    snippet_path, snippet_content = build_snippet_file(
+        snippets_dir, parent_filename, example_num, lang, code, annotations
+    )
+    _write_text(snippet_path, snippet_content)
     return snippet_path
 
 
+def _write_files(files):
+    """Write a list of (path, content) pairs"""
+    for path, content in files:
+        _write_text(path, content)
+
+
+def submit_snippet_writes(files):
+    """Start writing (path, content) pairs on the writer pool, returns the futures
+
+    Files are handed to the pool in batches of SNIPPET_WRITE_BATCH, so a
+    block's snippets cost one pool task rather than one per language.
+    """
+    files = list(files)
+    return [_WRITER_POOL.submit(_write_files, files[i:i + SNIPPET_WRITE_BATCH])
+            for i in range(0, len(files), SNIPPET_WRITE_BATCH)]
+
+
+def wait_for_writes(futures):
+    """Wait for background writes to finish, re-raising the first failure"""
+    for future in futures:
+        future.result()
+
+
+@functools.lru_cache(maxsize=None)
+def _language_tab_header(lang):
+    """Opening lines of a language's include tab, the same for every block"""
+    return _INCLUDE_TAB_TPL(label=_lang_info(lang)[2], sync=lang.lower())
+
+
 def build_include_directive(snippets_dir_name, parent_filename, example_num, lang):
     """Generate an include directive for a snippet.
 
@@ -381,8 +1060,8 @@ def build_include_directive(snippets_dir_name, parent_filename, example_num, lan
     Returns:
         String containing the include directive
     """
-    snippet_filename = f"example{example_num}-{lang}.md"
-    return f":::{{include}} {snippets_dir_name}/{parent_filename}/{snippet_filename}\n:::"
+    return _INCLUDE_TPL(snippets_dir_name=snippets_dir_name, parent_filename=parent_filename,
+                        example_num=example_num, lang=lang)
 
 
 def build_language_tab(lang, converted_code):
@@ -395,36 +1074,17 @@ def build_language_tab(lang, converted_code):
     Returns:
         str: Markdown for the language tab
     """
-    lang_label = LANGUAGE_MAP.get(lang.lower(), lang.capitalize())
-
-    # Apply language-specific post-processing
-    lang_lower = lang.lower()
-    if lang == 'curl':
-        converted_code = format_curl(converted_code)
-    elif lang_lower == 'python':
-        converted_code = format_python(converted_code)
-    elif lang_lower == 'ruby':
-        converted_code = format_ruby(converted_code)
-    elif lang_lower in ['js', 'javascript']:
-        converted_code = format_javascript(converted_code)
-    elif lang_lower == 'php':
-        converted_code = format_php(converted_code)
-
-    # Use 'bash' syntax highlighting for curl
-    code_lang = 'bash' if lang == 'curl' else lang
-
-    return f"""
-:::{{tab-item}} {lang_label}
-:sync: {lang}
-```{code_lang}
-{converted_code}
-```
-:::
-"""
+    # Apply language-specific post-processing ('bash' syntax highlighting for curl)
+    formatter, code_lang, lang_label = _lang_info(lang)
+    if formatter:
+        converted_code = formatter(converted_code)
+
+    return _LANG_TAB_TPL(label=lang_label, sync=lang, code_lang=code_lang, code=converted_code)
 
 
 def create_snippets_and_tabs(snippets_dir, parent_filename, example_num, code, annotations='',
-                             languages=None, is_first_block=False, block_type='console'):
+                             languages=None, is_first_block=False, block_type='console',
+                             converted=None):
     """Create snippet files and generate tab-set with include directives.
 
     Args:
@@ -436,6 +1096,7 @@ def create_snippets_and_tabs(snippets_dir, parent_filename, example_num, code, a
         languages: Target languages for conversion
         is_first_block: Whether this is the first block (keeps boilerplate)
         block_type: Type of code block - 'console' or 'esql'
+        converted: Optional (results, errors) from convert_console_batch; converted here if omitted
 
     Returns:
         tuple: (tabs_markdown, errors) where errors is dict of {language: error_message}
@@ -446,57 +1107,59 @@ def create_snippets_and_tabs(snippets_dir, parent_filename, example_num, code, a
     code = code.strip()
     errors = {}
 
-    # Prepare code for conversion
-    if block_type == 'esql':
-        # Write ES|QL snippet
-        write_snippet_file(snippets_dir, parent_filename, example_num, 'esql', code, annotations)
+    # Prepare code for conversion (strips annotations, wraps ES|QL in a console request)
+    code_to_convert = get_code_to_convert(code, block_type)
 
-        # Convert to console format for other languages
-        code_no_annotations = strip_annotations(code)
-        code_to_convert = esql_to_console(code_no_annotations)
-
-        # Write Console snippet
-        write_snippet_file(snippets_dir, parent_filename, example_num, 'console', code_to_convert)
+    if block_type == 'esql':
+        # ES|QL snippet plus the Console snippet it converts to
+        source_files = [
+            build_snippet_file(snippets_dir, parent_filename, example_num, 'esql', code, annotations),
+            build_snippet_file(snippets_dir, parent_filename, example_num, 'console', code_to_convert),
+        ]
     else:  # console
-        # Write Console snippet
-        write_snippet_file(snippets_dir, parent_filename, example_num, 'console', code, annotations)
-
-        # Strip annotations before converting
-        code_to_convert = strip_annotations(code)
-
-    # Convert to all target languages and write snippets
-    converted_codes, conversion_errors = convert_console(code_to_convert, languages, complete=is_first_block)
+        source_files = [
+            build_snippet_file(snippets_dir, parent_filename, example_num, 'console', code, annotations),
+        ]
+
+    # Convert to all target languages (source snippets are written in the background meanwhile)
+    writes = []
+    if converted is None:
+        writes = submit_snippet_writes(source_files)
+        source_files = []
+        converted = convert_console(code_to_convert, languages, complete=is_first_block)
+    converted_codes, conversion_errors = converted
     errors.update(conversion_errors)
 
-    for lang in languages:
-        write_snippet_file(snippets_dir, parent_filename, example_num, lang, converted_codes[lang])
+    # Write all of this block's snippets in one batch
+    writes += submit_snippet_writes(source_files + [
+        build_snippet_file(snippets_dir, parent_filename, example_num, lang, converted_codes[lang])
+        for lang in languages
+    ])
 
     # Build tab-set with include directives
-    tabs = "::::{tab-set}\n:group: api-examples\n\n"
+    parts = [_TAB_SET_START]
 
     # Add ES|QL tab if this was an esql block
     if block_type == 'esql':
-        tabs += ":::{tab-item} ES|QL\n:sync: esql\n\n"
-        tabs += build_include_directive('_snippets', parent_filename, example_num, 'esql')
-        tabs += "\n\n"
+        parts.append(_INCLUDE_TAB_TPL(label='ES|QL', sync='esql'))
+        parts.append(build_include_directive('_snippets', parent_filename, example_num, 'esql'))
+        parts.append("\n\n")
 
     # Add Console tab
-    tabs += ":::{tab-item} Console\n:sync: console\n\n"
-    tabs += build_include_directive('_snippets', parent_filename, example_num, 'console')
-    tabs += "\n\n"
+    parts.append(_INCLUDE_TAB_TPL(label='Console', sync='console'))
+    parts.append(build_include_directive('_snippets', parent_filename, example_num, 'console'))
+    parts.append("\n\n")
 
     # Add language tabs
     for lang in languages:
-        lang_label = LANGUAGE_MAP.get(lang.lower(), lang.capitalize())
-        sync_key = lang.lower()
+        parts.append(_language_tab_header(lang))
+        parts.append(build_include_directive('_snippets', parent_filename, example_num, lang))
+        parts.append("\n\n")
 
-        tabs += f":::{{tab-item}} {lang_label}\n:sync: {sync_key}\n\n"
-        tabs += build_include_directive('_snippets', parent_filename, example_num, lang)
-        tabs += "\n\n"
+    parts.append("::::")
 
-    tabs += "::::"
-
-    return tabs, errors
+    wait_for_writes(writes)
+    return "".join(parts), errors
 
 
 def wrap_in_tabs(code, annotations='', languages=None, is_first_block=False, block_type='console'):
@@ -519,32 +1182,21 @@ def wrap_in_tabs(code, annotations='', languages=None, is_first_block=False, blo
     code_to_convert, first_tab = prepare_code_for_conversion(code, block_type, annotations)
 
     # Start tab-set with first tab
-    tabs = f"""::::{{tab-set}}
-:group: api-examples
-
-"""
-    tabs += first_tab
+    parts = [_TAB_SET_START, first_tab]
 
     # Add Console tab for ES|QL blocks
     if block_type == 'esql':
-        tabs += f"""
-:::{{tab-item}} Console
-:sync: console
-```console
-{code_to_convert}
-```
-:::
-"""
+        parts.append("\n" + _CONSOLE_TAB_TPL(code=code_to_convert) + ":::\n")
 
     # Convert to all target languages
     converted_codes, conversion_errors = convert_console(code_to_convert, languages, complete=is_first_block)
 
     # Build language tabs
     for lang in languages:
-        tabs += build_language_tab(lang, converted_codes[lang])
+        parts.append(build_language_tab(lang, converted_codes[lang]))
 
-    tabs += "\n::::"
-    return tabs, conversion_errors
+    parts.append("\n::::")
+    return "".join(parts), conversion_errors
 
 
 
@@ -559,28 +1211,38 @@ def replace_blocks(markdown_text, console_replacements, esql_replacements):
     Returns:
         Updated markdown text
     """
-    # First, replace console blocks
-    console_pattern = r"```console\n(.*?)\n```(?:\n\n(\d+\.[^\n]+(?:\n\d+\.[^\n]+)*))?"
+    # Replace console and esql blocks in a single scan over the text
     console_iter = iter(console_replacements)
+    esql_iter = iter(esql_replacements)
 
-    def console_replacer(match):
-        content = match.group(1)
-        if content.startswith('-result'):
-            return match.group(0)  # Return original, don't replace
-        return next(console_iter)
+    def spans():
+        for block_type, start, end, code, _ in _source_blocks(markdown_text):
+            if block_type == 'esql':
+                yield start, end, next(esql_iter)
+            elif not code.startswith('-result'):  # Keep result blocks, don't replace
+                yield start, end, next(console_iter)
 
-    markdown_text = re.sub(console_pattern, console_replacer, markdown_text, flags=re.DOTALL)
+    return splice_spans(markdown_text, spans())
 
-    # Then, replace esql blocks
-    esql_pattern = r"```esql\n(.*?)\n```(?:\n\n(\d+\.[^\n]+(?:\n\d+\.[^\n]+)*))?"
-    esql_iter = iter(esql_replacements)
 
-    def esql_replacer(match):
-        return next(esql_iter)
+def splice_spans(text, spans):
+    """Replace (start, end, replacement) spans of a text, building the result in one join
 
-    markdown_text = re.sub(esql_pattern, esql_replacer, markdown_text, flags=re.DOTALL)
+    Args:
+        text: The original text
+        spans: Iterable of (start, end, replacement), in order and non-overlapping
 
-    return markdown_text
+    Returns:
+        The text with every span replaced
+    """
+    parts = []
+    pos = 0
+    for start, end, replacement in spans:
+        parts.append(text[pos:start])
+        parts.append(replacement)
+        pos = end
+    parts.append(text[pos:])
+    return ''.join(parts)
 
 
 def has_console_snippets(snippets_dir):
@@ -594,25 +1256,30 @@ def has_console_snippets(snippets_dir):
     """
     if not snippets_dir.exists():
         return False
-    return len(list(snippets_dir.glob('example*-console.md'))) > 0
+    return next(snippets_dir.glob('example*-console.md'), None) is not None
 
 
-def get_console_snippets(snippets_dir):
-    """Get all console snippet files sorted by example number
+def list_snippet_files(snippets_dir):
+    """List all example*.md snippet files with a single directory scan
 
     Args:
         snippets_dir: Path to _snippets/{filename} directory
 
     Returns:
-        list: Sorted list of (example_num, snippet_path) tuples
+        list: Paths of snippet files (empty if the directory doesn't exist)
     """
-    console_files = list(snippets_dir.glob('example*-console.md'))
+    if not snippets_dir.exists():
+        return []
+    return [path for path in snippets_dir.iterdir()
+            if path.name.startswith('example') and path.name.endswith('.md')]
 
-    # Extract example numbers and sort
+
+def _numbered_snippets(snippet_files, name_re):
+    """Select snippet files matching name_re, sorted by their example number"""
     snippets = []
-    for path in console_files:
+    for path in snippet_files:
         # Parse example number from filename like "example3-console.md"
-        match = re.match(r'example(\d+)-console\.md', path.name)
+        match = name_re.match(path.name)
         if match:
             example_num = int(match.group(1))
             snippets.append((example_num, path))
@@ -620,6 +1287,21 @@ def get_console_snippets(snippets_dir):
     return sorted(snippets, key=lambda x: x[0])
 
 
+def get_console_snippets(snippets_dir, snippet_files=None):
+    """Get all console snippet files sorted by example number
+
+    Args:
+        snippets_dir: Path to _snippets/{filename} directory
+        snippet_files: Optional result of list_snippet_files to avoid another scan
+
+    Returns:
+        list: Sorted list of (example_num, snippet_path) tuples
+    """
+    if snippet_files is None:
+        snippet_files = snippets_dir.glob('example*-console.md')
+    return _numbered_snippets(snippet_files, _CONSOLE_SNIPPET_NAME_RE)
+
+
 def parse_snippet_file(snippet_path):
     """Parse a snippet file to extract code and annotations
 
@@ -633,42 +1315,35 @@ def parse_snippet_file(snippet_path):
         content = f.read()
 
     # Extract code block
-    code_match = re.search(r'```(?:console|esql)\n(.*?)\n```', content, re.DOTALL)
+    code_match = _SNIPPET_CODE_RE.search(content)
     if not code_match:
         return '', ''
 
     code = code_match.group(1)
 
     # Extract annotations (numbered list after code block)
-    annotations_match = re.search(r'```\n\n(\d+\.[^\n]+(?:\n\d+\.[^\n]+)*)', content)
+    annotations_match = _SNIPPET_ANNOTATIONS_RE.search(content)
     annotations = annotations_match.group(1).strip() if annotations_match else ''
 
     return code, annotations
 
 
-def clean_language_snippets(snippets_dir, keep_languages=['console', 'esql']):
+def clean_language_snippets(snippets_dir, keep_languages=SOURCE_LANGUAGES):
     """Delete all language snippet files except specified ones
 
     Args:
         snippets_dir: Path to _snippets/{filename} directory
-        keep_languages: List of language extensions to keep (default: console, esql)
+        keep_languages: Language extensions to keep (default: console, esql)
 
     Returns:
         int: Number of files deleted
     """
-    if not snippets_dir.exists():
-        return 0
+    keep_suffixes = tuple(f'-{lang}.md' for lang in keep_languages)
 
     deleted_count = 0
-    for snippet_file in snippets_dir.glob('example*.md'):
+    for snippet_file in list_snippet_files(snippets_dir):
         # Check if this is a file we want to keep
-        should_keep = False
-        for lang in keep_languages:
-            if snippet_file.name.endswith(f'-{lang}.md'):
-                should_keep = True
-                break
-
-        if not should_keep:
+        if not snippet_file.name.endswith(keep_suffixes):
             snippet_file.unlink()
             deleted_count += 1
 
@@ -684,8 +1359,32 @@ def count_tabsets_in_markdown(markdown_text):
     Returns:
         int: Number of ::::{tab-set} blocks found
     """
-    tabset_pattern = r'::::\{tab-set\}'
-    return len(re.findall(tabset_pattern, markdown_text))
+    return markdown_text.count(_TABSET_START)
+
+
+def _write_report(lines):
+    """Print a group of report lines with a single write to stdout"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
+
+def _print_banner(*lines, trailing_blank=False):
+    """Print lines framed by '=' rules (with a blank line before) in one write"""
+    _write_report(['', '=' * 60, *lines, '=' * 60] + ([''] if trailing_blank else []))
+
+
+def _print_errors(heading, errors_by_item):
+    """Print conversion errors in one write
+
+    Args:
+        heading: Line introducing the errors
+        errors_by_item: {item label: {lang: error_msg}}
+    """
+    lines = ['', heading]
+    for label, errors in errors_by_item.items():
+        lines.append(f"   {label}:")
+        lines.extend(f"      • {lang}: {error_msg}" for lang, error_msg in errors.items())
+    lines.append('')
+    _write_report(lines)
 
 
 def regenerate_from_snippets(filepath, languages=None):
@@ -709,25 +1408,23 @@ def regenerate_from_snippets(filepath, languages=None):
     parent_filename = filepath.stem
     snippets_dir = filepath.parent / '_snippets' / parent_filename
 
-    print(f"\n{'='*60}")
-    print(f"📄 File: {filepath.name}")
-    print(f"🔄 Regenerating from console snippets")
-    print(f"🎯 Target languages: {', '.join(target_langs)}")
-    print(f"{'='*60}")
+    _print_banner(
+        f"📄 File: {filepath.name}",
+        f"🔄 Regenerating from console snippets",
+        f"🎯 Target languages: {', '.join(target_langs)}"
+    )
 
-    # Check if console snippets exist
-    if not has_console_snippets(snippets_dir):
+    # Scan the snippets directory once, then check if console snippets exist
+    snippet_files = list_snippet_files(snippets_dir)
+    console_snippets = get_console_snippets(snippets_dir, snippet_files)
+    if not console_snippets:
         print("❌ No console snippets found")
         return False
 
     # Clean ALL snippet files (we'll regenerate console snippets with clean numbering)
-    deleted_count = 0
-    for snippet_file in snippets_dir.glob('example*.md'):
-        deleted_count += 1
-    print(f"🗑️  Cleaning {deleted_count} old snippet file(s)")
+    print(f"🗑️  Cleaning {len(snippet_files)} old snippet file(s)")
 
-    # Get all console snippets BEFORE deleting
-    console_snippets = get_console_snippets(snippets_dir)
+    # Console snippets were collected BEFORE deleting
     print(f"🔍 Found {len(console_snippets)} console snippet(s)")
 
     # Read console snippet data before cleaning
@@ -745,7 +1442,7 @@ def regenerate_from_snippets(filepath, languages=None):
         print(f"🔢 Renumbering snippets sequentially: {actual_numbers} → {expected_numbers}")
 
     # Clean all snippets
-    for snippet_file in snippets_dir.glob('example*.md'):
+    for snippet_file in snippet_files:
         snippet_file.unlink()
 
     # Read markdown and check tab-set count
@@ -756,53 +1453,58 @@ def regenerate_from_snippets(filepath, languages=None):
 
     all_errors = {}
 
-    # Process each console snippet with sequential numbering
-    for new_num, (console_code, annotations) in enumerate(tqdm(console_data, desc="   ⏳ Regenerating snippets", unit="snippet"), start=1):
-        # Write console snippet with new sequential number
-        write_snippet_file(snippets_dir, parent_filename, new_num, 'console', console_code, annotations)
-
-        # Strip annotations before converting
-        code_to_convert = strip_annotations(console_code)
+    # Write console snippets with new sequential numbers in the background while converting
+    writes = submit_snippet_writes(
+        build_snippet_file(snippets_dir, parent_filename, new_num, 'console', console_code, annotations)
+        for new_num, (console_code, annotations) in enumerate(console_data, start=1)
+    )
 
-        # Convert to all target languages
-        # First snippet gets complete=True to keep boilerplate
-        is_first = (new_num == 1)
-        converted_codes, conversion_errors = convert_console(code_to_convert, target_langs, complete=is_first)
+    # Convert all console snippets to all target languages in one batch
+    # First snippet gets complete=True to keep boilerplate
+    with _progress_bar(len(console_data), "   ⏳ Regenerating snippets", "snippet") as progress:
+        converted = convert_console_batch(
+            [strip_annotations(console_code) for console_code, _ in console_data],
+            target_langs, progress=progress
+        )
 
+    # Write language snippets with new sequential numbers
+    for new_num, (converted_codes, conversion_errors) in enumerate(converted, start=1):
         if conversion_errors:
             all_errors[new_num] = conversion_errors
 
-        # Write language snippets with new sequential number
-        for lang in target_langs:
-            write_snippet_file(snippets_dir, parent_filename, new_num, lang, converted_codes[lang])
+        writes += submit_snippet_writes(
+            build_snippet_file(snippets_dir, parent_filename, new_num, lang, converted_codes[lang])
+            for lang in target_langs
+        )
+
+    wait_for_writes(writes)
 
     # Update include directives in markdown to use new numbering
     if actual_numbers != expected_numbers or len(console_data) != tabset_count:
         print(f"📝 Updating include directives in markdown...")
 
-        # Update include paths to use new sequential numbering
+        # Update include paths to use new sequential numbering, all in one pass
         # Pattern: :::include _snippets/{parent}/exampleN-{lang}.md
-        for old_num, new_num in zip(actual_numbers, expected_numbers):
-            if old_num != new_num:
-                # Replace old example number with new in include directives
-                old_pattern = rf'(_snippets/{parent_filename}/example){old_num}(-\w+\.md)'
-                new_replacement = rf'\g<1>{new_num}\g<2>'
-                markdown_text = re.sub(old_pattern, new_replacement, markdown_text)
+        renumbered = {str(old_num): str(new_num)
+                      for old_num, new_num in zip(actual_numbers, expected_numbers) if old_num != new_num}
 
-        # Write updated markdown
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(markdown_text)
+        def renumber_include(match):
+            prefix, parent, num, suffix = match.groups()
+            if parent != parent_filename or num not in renumbered:
+                return match.group(0)
+            return prefix + renumbered[num] + suffix
 
-        print(f"✅ Updated include directives in markdown")
+        # Write updated markdown
+        if write_markdown_if_changed(filepath, markdown_text,
+                                     _INCLUDE_EXAMPLE_RE.sub(renumber_include, markdown_text)):
+            print(f"✅ Updated include directives in markdown")
+        else:
+            print(f"ℹ️  Include directives unchanged, markdown not rewritten")
 
     # Report results
     if all_errors:
-        print(f"\n⚠️  Completed with errors:")
-        for example_num, errors in all_errors.items():
-            print(f"   Example {example_num}:")
-            for lang, error_msg in errors.items():
-                print(f"      • {lang}: {error_msg}")
-        print()
+        _print_errors(f"⚠️  Completed with errors:",
+                      {f"Example {example_num}": errors for example_num, errors in all_errors.items()})
         return False
     else:
         print(f"✅ Successfully regenerated {len(console_data)} snippet(s)\n")
@@ -811,21 +1513,26 @@ def regenerate_from_snippets(filepath, languages=None):
 
 def has_language_tabs(markdown_text, languages):
     """Check if the markdown already contains tabs for the specified languages or ES|QL tabs"""
-    if languages is None:
+    if not languages:
         languages = DEFAULT_LANGUAGES
 
+    # Every tab pattern needs a {tab-item} directive, so one scan clears files without
+    # any tabs instead of one scan per language
+    if not _TAB_ITEM_RE.search(markdown_text):
+        return False, None
+
     # Check for ES|QL tabs
-    esql_pattern = r':::+\{tab-item\}\s+ES\|QL\s*\n\s*:sync:\s+esql'
-    if re.search(esql_pattern, markdown_text, re.IGNORECASE):
+    if _ESQL_TAB_RE.search(markdown_text):
         return True, 'esql'
 
     for lang in languages:
         # Check for language-specific tab items
         # Look for the pattern: "::::{tab-item} Python" followed by ":sync: python"
-        lang_label = lang.capitalize()
         # Must have both the tab-item AND sync on the next line to be a language tab
-        pattern = r':::+\{tab-item\}\s+' + re.escape(lang_label) + r'\s*\n\s*:sync:\s+' + re.escape(lang.lower())
-        if re.search(pattern, markdown_text, re.IGNORECASE):
+        pattern = _LANG_TAB_RES.get(lang)
+        if pattern is None:
+            pattern = _lang_tab_re(lang)
+        if pattern.search(markdown_text):
             return True, lang
 
     return False, None
@@ -840,28 +1547,20 @@ def undo_snippets(filepath):
     Returns:
         bool: True if successful
     """
-    import shutil
-
     parent_filename = filepath.stem
     snippets_dir = filepath.parent / '_snippets' / parent_filename
 
-    print(f"\n{'='*60}")
-    print(f"📄 File: {filepath.name}")
-    print(f"🔙 Undoing snippetization")
-    print(f"{'='*60}")
+    _print_banner(f"📄 File: {filepath.name}", f"🔙 Undoing snippetization")
 
     # Check if snippets directory exists
     if not snippets_dir.exists():
         print("❌ No snippets directory found")
         return False
 
-    # Get all console and esql snippets
-    console_snippets = get_console_snippets(snippets_dir)
-    esql_snippets = sorted(
-        [(int(re.match(r'example(\d+)-esql\.md', p.name).group(1)), p)
-         for p in snippets_dir.glob('example*-esql.md')],
-        key=lambda x: x[0]
-    ) if list(snippets_dir.glob('example*-esql.md')) else []
+    # Get all console and esql snippets from a single directory scan
+    snippet_files = list_snippet_files(snippets_dir)
+    console_snippets = get_console_snippets(snippets_dir, snippet_files)
+    esql_snippets = _numbered_snippets(snippet_files, _ESQL_SNIPPET_NAME_RE)
 
     if not console_snippets and not esql_snippets:
         print("❌ No console or esql snippets found")
@@ -893,22 +1592,16 @@ def undo_snippets(filepath):
             replacement += f"\n\n{annotations}"
         replacements.append(replacement)
 
-    # Replace tab-sets with original code blocks
-    # Pattern matches tab-set blocks
-    tabset_pattern = r'::::\{tab-set\}.*?::::'
-    replacement_iter = iter(replacements)
-
-    def replace_tabset(match):
-        try:
-            return next(replacement_iter)
-        except StopIteration:
-            return match.group(0)  # Keep original if we run out of replacements
-
-    updated_markdown = re.sub(tabset_pattern, replace_tabset, markdown_text, flags=re.DOTALL)
+    # Replace tab-sets with original code blocks, in order
+    # Scanning stops after the last replacement; any extra tab-sets are kept as is
+    tabsets = _TABSET_BLOCK_RE.finditer(markdown_text)
+    updated_markdown = splice_spans(markdown_text, (
+        (match.start(), match.end(), replacement) for replacement, match in zip(replacements, tabsets)
+    ))
 
     # Write updated markdown
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(updated_markdown)
+    if not write_markdown_if_changed(filepath, markdown_text, updated_markdown):
+        print(f"ℹ️  Markdown unchanged, not rewritten")
 
     # Delete only the page-specific snippets subdirectory (_snippets/{filename}/)
     shutil.rmtree(snippets_dir)
@@ -917,10 +1610,13 @@ def undo_snippets(filepath):
     print(f"✅ Successfully restored {len(replacements)} code block(s)\n")
     return True
 
-def process_file(filepath, languages=None, regenerate=False, undo=False):
-    """Process a single markdown file"""
-    target_langs = languages if languages else DEFAULT_LANGUAGES
+def process_file(filepath, languages=None, regenerate=False, undo=False, pending_writes=None):
+    """Process a single markdown file
 
+    In normal mode, if pending_writes (a list) is given, the updated markdown is
+    written on the writer pool and the future is appended to it, so the caller
+    can move on to the next file and wait for the writes later.
+    """
     # Handle undo mode
     if undo:
         return undo_snippets(filepath)
@@ -929,16 +1625,33 @@ def process_file(filepath, languages=None, regenerate=False, undo=False):
     if regenerate:
         snippets_dir = filepath.parent / '_snippets' / filepath.stem
         if not has_console_snippets(snippets_dir):
-            print(f"❌ No console snippets found for {filepath.name}")
-            print(f"   Run without --regenerate to create snippets first.")
+            _write_report([f"❌ No console snippets found for {filepath.name}",
+                           f"   Run without --regenerate to create snippets first."])
             return False
         return regenerate_from_snippets(filepath, languages)
 
     # Normal processing mode
-    print(f"\n{'='*60}")
-    print(f"📄 File: {filepath.name}")
-    print(f"🎯 Target languages: {', '.join(target_langs)}")
-    print(f"{'='*60}")
+    job = prepare_file(filepath, languages)
+    if job is None:
+        return False
+    convert_files([job], languages)
+    return finish_file(job, pending_writes)
+
+
+def prepare_file(filepath, languages=None):
+    """First step of processing a file: read it and collect the blocks to convert
+
+    Args:
+        filepath: Path to markdown file
+        languages: Target languages (defaults to DEFAULT_LANGUAGES)
+
+    Returns:
+        dict: The file's conversion job (for convert_files and finish_file),
+            or None if the file is skipped
+    """
+    target_langs = languages if languages else DEFAULT_LANGUAGES
+
+    _print_banner(f"📄 File: {filepath.name}", f"🎯 Target languages: {', '.join(target_langs)}")
 
     # Read the file
     with open(filepath, 'r', encoding='utf-8') as f:
@@ -948,7 +1661,13 @@ def process_file(filepath, languages=None, regenerate=False, undo=False):
     has_tabs, found_lang = has_language_tabs(markdown_text, languages)
     if has_tabs:
         print(f"⚠️  Already contains {found_lang} tabs (use --regenerate to update)")
-        return False
+        return None
+
+    # Skip the directive and extraction passes (and their copies of the text) when
+    # there is no opening fence to convert
+    if not any(fence in markdown_text for fence in ('```console\n', '```esql\n')):
+        print(f"ℹ️  No console or esql blocks found")
+        return None
 
     # Increment existing directive nesting BEFORE adding new tab-sets
     # This ensures existing nested directives maintain correct nesting after we add outer tab-sets
@@ -961,7 +1680,7 @@ def process_file(filepath, languages=None, regenerate=False, undo=False):
 
     if not console_blocks and not esql_blocks:
         print(f"ℹ️  No console or esql blocks found")
-        return False
+        return None
 
     if console_blocks:
         print(f"🔍 Found {len(console_blocks)} console block(s)")
@@ -981,58 +1700,137 @@ def process_file(filepath, languages=None, regenerate=False, undo=False):
         snippets_dir.mkdir(parents=True, exist_ok=True)
         print(f"📁 Created snippets directory: _snippets/{parent_filename}/")
 
-    # Convert console blocks and collect errors
-    console_tabs = []
-    all_errors = {}  # {('console'|'esql', block_num): {lang: error_msg}}
+    # Console blocks are numbered first, then esql blocks (only the very first block keeps boilerplate)
+    blocks = [(code, annotations, 'console') for code, annotations in console_blocks]
+    blocks += [(code, annotations, 'esql') for code, annotations in esql_blocks]
 
-    if console_blocks:
-        for i, (console_code, annotations) in enumerate(tqdm(console_blocks, desc="   ⏳ Converting console blocks", unit="block")):
-            tab, errors = create_snippets_and_tabs(
-                snippets_dir, parent_filename, i + 1, console_code, annotations,
-                languages, is_first_block=(i == 0), block_type='console'
+    return {
+        'filepath': filepath,
+        'markdown_text': markdown_text,
+        'snippets_dir': snippets_dir,
+        'blocks': blocks,  # [(code, annotations, block_type), ...]
+        'console_count': len(console_blocks),
+        'results': None,  # [(tabs_markdown, errors), ...] once converted
+    }
+
+
+def convert_files(jobs, languages=None):
+    """Convert the blocks of one or more prepared files in a single batch
+
+    Blocks from all files share one conversion queue and progress bar, so a
+    directory run keeps the converter busy across file boundaries. Each block's
+    snippets and tab-set are built on the block pool as soon as it is converted.
+    Fills in each job's 'results' in block order.
+
+    Args:
+        jobs: Conversion jobs from prepare_file
+        languages: Target languages (defaults to DEFAULT_LANGUAGES)
+    """
+    target_langs = languages if languages else DEFAULT_LANGUAGES
+    owners = [(job, i) for job in jobs for i in range(len(job['blocks']))]  # Batch index -> (job, block)
+    block_futures = [None] * len(owners)
+
+    # The progress bar counts finished blocks
+    with _progress_bar(len(owners), "   ⏳ Converting blocks", "block") as progress:
+
+        def start_block(n, converted):
+            job, i = owners[n]
+            code, annotations, block_type = job['blocks'][i]
+            block_futures[n] = _BLOCK_POOL.submit(
+                create_snippets_and_tabs, job['snippets_dir'], job['filepath'].stem, i + 1, code,
+                annotations, languages, is_first_block=(i == 0), block_type=block_type,
+                converted=converted
             )
-            console_tabs.append(tab)
-            if errors:
-                all_errors[('console', i + 1)] = errors
+            block_futures[n].add_done_callback(lambda _: progress.update(1))
+
+        # The first block of each file keeps client boilerplate
+        convert_console_batch(
+            [get_code_to_convert(job['blocks'][i][0], job['blocks'][i][2]) for job, i in owners],
+            target_langs, on_converted=start_block,
+            complete_blocks={n for n, (_, i) in enumerate(owners) if i == 0}
+        )
+
+        # Results are indexed by block so tab-sets keep document order
+        for job in jobs:
+            job['results'] = [None] * len(job['blocks'])
+        index_of = {future: n for n, future in enumerate(block_futures)}
+        for future in as_completed(block_futures):
+            job, i = owners[index_of[future]]
+            job['results'][i] = future.result()
+
+
+def finish_file(job, pending_writes=None):
+    """Last step of processing a file: replace its blocks with tab-sets and report
+
+    Args:
+        job: Conversion job from prepare_file, converted by convert_files
+        pending_writes: Optional list, see process_file
 
-    # Convert esql blocks and collect errors
+    Returns:
+        bool: True if the file was updated without errors
+    """
+    filepath = job['filepath']
+    markdown_text = job['markdown_text']
+    blocks = job['blocks']
+
+    # Collect tab-sets in document order, and errors
+    console_tabs = []
     esql_tabs = []
+    all_errors = {}  # {('console'|'esql', block_num): {lang: error_msg}}
 
-    if esql_blocks:
-        for i, (esql_code, annotations) in enumerate(tqdm(esql_blocks, desc="   ⏳ Converting esql blocks", unit="block")):
-            tab, errors = create_snippets_and_tabs(
-                snippets_dir, parent_filename, len(console_blocks) + i + 1, esql_code, annotations,
-                languages, is_first_block=(i == 0 and not console_blocks), block_type='esql'
-            )
+    for i, (tab, errors) in enumerate(job['results']):
+        if blocks[i][2] == 'console':
+            console_tabs.append(tab)
+            block_key = ('console', i + 1)
+        else:
             esql_tabs.append(tab)
-            if errors:
-                all_errors[('esql', i + 1)] = errors
+            block_key = ('esql', i + 1 - job['console_count'])
+        if errors:
+            all_errors[block_key] = errors
 
     # Replace blocks
     print(f"📝 Updating markdown...")
     updated_markdown = replace_blocks(markdown_text, console_tabs, esql_tabs)
 
     # Write file
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(updated_markdown)
+    if not write_markdown_if_changed(filepath, markdown_text, updated_markdown, pending_writes):
+        print(f"ℹ️  Markdown unchanged, not rewritten")
 
     # Report results
     if all_errors:
-        print(f"\n⚠️  Completed with errors in {filepath.name}:")
-        for (block_type, block_num), errors in all_errors.items():
-            print(f"   {block_type.capitalize()} block {block_num}:")
-            for lang, error_msg in errors.items():
-                print(f"      • {lang}: {error_msg}")
-        print()
+        _print_errors(f"⚠️  Completed with errors in {filepath.name}:", {
+            f"{block_type.capitalize()} block {block_num}": errors
+            for (block_type, block_num), errors in all_errors.items()
+        })
         return False
     else:
         print(f"✅ Successfully updated {filepath.name}\n")
         return True
 
 
+def _init_file_worker():
+    """Set up a worker process for process_directory"""
+    global _show_progress, _worker, _disk_cache
+    _show_progress = False
+    # Each process starts its own converter worker and cache connection instead of
+    # using ones inherited from the parent
+    _worker = None
+    _disk_cache = None
+
+
+def _process_file_captured(filepath, languages=None, regenerate=False, undo=False):
+    """Run process_file in a worker process, returns (result, printed report)"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = process_file(filepath, languages, regenerate, undo)
+    return result, output.getvalue()
+
+
 def process_directory(dirpath, languages=None, regenerate=False, undo=False):
     """Process all markdown files in a directory (non-recursive)"""
-    md_files = list(Path(dirpath).glob('*.md'))
+    # scandir answers is_file() from the directory entry, without a stat() per file
+    with os.scandir(dirpath) as entries:
+        md_files = [Path(entry.path) for entry in entries if entry.name.endswith('.md') and entry.is_file()]
 
     if not md_files:
         print(f"❌ No markdown files found in {dirpath}")
@@ -1046,31 +1844,73 @@ def process_directory(dirpath, languages=None, regenerate=False, undo=False):
     else:
         mode = "Processing"
 
-    print(f"\n{'='*60}")
-    print(f"📁 Directory: {dirpath}")
-    print(f"📄 Found {len(md_files)} markdown file(s)")
+    header = [f"📁 Directory: {dirpath}", f"📄 Found {len(md_files)} markdown file(s)"]
     if not undo:
-        print(f"🎯 Target languages: {', '.join(target_langs)}")
-    print(f"🔄 Mode: {mode}")
-    print(f"{'='*60}\n")
+        header.append(f"🎯 Target languages: {', '.join(target_langs)}")
+    header.append(f"🔄 Mode: {mode}")
+    _print_banner(*header, trailing_blank=True)
 
     updated_count = 0
     skipped_count = 0
 
-    for filepath in md_files:
-        if process_file(filepath, languages, regenerate, undo):
-            updated_count += 1
-        else:
-            skipped_count += 1
-
-    print(f"\n{'='*60}")
-    print(f"📊 Summary:")
-    print(f"   ✅ Updated: {updated_count} file(s)")
-    print(f"   ⏭️  Skipped: {skipped_count} file(s)")
-    print(f"{'='*60}\n")
+    if len(md_files) > PARALLEL_FILE_THRESHOLD:
+        # Files are independent: process them in worker processes, printing
+        # each file's report in order once it is done
+        from concurrent.futures import ProcessPoolExecutor
+
+        worker = functools.partial(_process_file_captured, languages=languages,
+                                   regenerate=regenerate, undo=undo)
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_file_worker) as executor:
+            for result, report in executor.map(worker, md_files):
+                sys.stdout.write(report)
+                if result:
+                    updated_count += 1
+                else:
+                    skipped_count += 1
+    elif regenerate or undo:
+        for filepath in md_files:
+            if process_file(filepath, languages, regenerate, undo):
+                updated_count += 1
+            else:
+                skipped_count += 1
+    else:
+        # Convert the blocks of all files in one batch, then print each file's
+        # report in order as it is finished
+        reports = []
+        for filepath in md_files:
+            report = io.StringIO()
+            with contextlib.redirect_stdout(report):
+                job = prepare_file(filepath, languages)
+            reports.append((job, report))
+
+        jobs = [job for job, _ in reports if job is not None]
+        if jobs:  # Nothing to convert when every file was skipped
+            convert_files(jobs, languages)
+
+        pending_writes = []
+        for job, report in reports:
+            result = False
+            if job is not None:
+                with contextlib.redirect_stdout(report):
+                    result = finish_file(job, pending_writes)
+            sys.stdout.write(report.getvalue())
+            if result:
+                updated_count += 1
+            else:
+                skipped_count += 1
+        wait_for_writes(pending_writes)
+
+    _print_banner(
+        f"📊 Summary:",
+        f"   ✅ Updated: {updated_count} file(s)",
+        f"   ⏭️  Skipped: {skipped_count} file(s)",
+        trailing_blank=True
+    )
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(
         description='Add language tabs to Elasticsearch documentation markdown files',
         epilog="""
@@ -1131,6 +1971,10 @@ Examples:
     # Determine languages to use
     languages = args.languages if args.languages else None
 
+    # Regenerating is how newer converter output is picked up, so start from an empty cache
+    if args.regenerate:
+        clear_conversion_cache()
+
     if path.is_file():
         if path.suffix != '.md':
             print(f"❌ Error: {path} is not a markdown file")
@@ -0,0 +1,77 @@
+#!/usr/bin/env node
+/*
+ * Long-running conversion worker for add-language-examples.py.
+ * Keeps a single Node process (and the loaded request-converter library) alive
+ * for the whole run instead of starting `es-request-converter` per conversion.
+ *
+ * Protocol (newline-delimited JSON):
+ *   stdin:  {"id": 1, "format": "Python", "complete": true, "console": "GET /_search"}
+ *           or an array of such requests on one line
+ *   stdout: {"id": 1, "code": "...", "error": null} (one line per request)
+ *
+ * Usage: node converter_server.js [path-to-@elastic/request-converter]
+ */
+
+const readline = require('readline');
+const { pathToFileURL } = require('url');
+
+// stdout carries the protocol, so library logging goes to stderr
+console.log = console.info = console.error;
+
+async function loadConverter(target) {
+  try {
+    return require(target);
+  } catch (err) {
+    if (err.code !== 'ERR_REQUIRE_ESM') {
+      throw err;
+    }
+    return import(pathToFileURL(require.resolve(target)).href);
+  }
+}
+
+function resolveFormat(converter, format) {
+  // The CLI accepts "Python", "JavaScript", etc. - match the library's names case-insensitively
+  const formats = typeof converter.listFormats === 'function' ? converter.listFormats() : [];
+  const wanted = String(format).toLowerCase();
+  return formats.find((name) => name.toLowerCase() === wanted) || wanted;
+}
+
+function respond(id, code, error) {
+  process.stdout.write(JSON.stringify({ id, code, error }) + '\n');
+}
+
+async function main() {
+  let converter;
+  try {
+    converter = await loadConverter(process.argv[2] || '@elastic/request-converter');
+  } catch (err) {
+    process.stderr.write(`Cannot load @elastic/request-converter: ${err.message}\n`);
+    process.exit(1);
+  }
+
+  async function convert(request) {
+    try {
+      const code = await converter.convertRequests(
+        request.console,
+        resolveFormat(converter, request.format),
+        { printResponse: true, complete: Boolean(request.complete) }
+      );
+      respond(request.id, code, null);
+    } catch (err) {
+      respond(request.id, null, String(err));
+    }
+  }
+
+  const input = readline.createInterface({ input: process.stdin, terminal: false });
+  input.on('line', (line) => {
+    if (!line.trim()) {
+      return;
+    }
+    const requests = JSON.parse(line);
+    for (const request of Array.isArray(requests) ? requests : [requests]) {
+      convert(request);
+    }
+  });
+}
+
+main();